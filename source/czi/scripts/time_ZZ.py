@@ -1,8 +1,9 @@
 from operator import mul
-from itertools import starmap
 from collections import deque
 import random
-from time import time
+import gc
+from time import perf_counter_ns
+from statistics import median
 from sympy.external.pythonmpq import PythonMPQ
 
 from gmpy2 import mpz, mpq
@@ -10,29 +11,45 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 def rand_ZZ(bits):
-    return random.randint(2**(bits-1), 2**bits-1)
+    return random.getrandbits(bits-1) | 1 << (bits-1)
+
+def rand_ZZ_list(bits, n):
+    if bits <= 62:
+        return np.random.randint(1 << (bits-1), 1 << bits, size=n, dtype=np.int64).tolist()
+    else:
+        return [rand_ZZ(bits) for _ in range(n)]
 
 def rand_QQ(bits):
-    return pythonmpq(rand_ZZ(bits), rand_ZZ(bits))
+    return PythonMPQ(rand_ZZ(bits), rand_ZZ(bits))
 
 def iconsume(iterator):
     deque(iterator, 0)
 
-def time_f_ns(func, args, _time=time, _iconsume=iconsume):
-    results = starmap(func, args)
+def time_f_ns(func, args1, args2, _time=perf_counter_ns, _iconsume=iconsume):
+    results = map(func, args1, args2)
     tstart = _time()
     _iconsume(results)
-    tdelta = _time()  - tstart
-    return tdelta * 1e9
+    tdelta = _time() - tstart
+    return tdelta
+
+def time_median_ns(func, *args, nsamples=7):
+    gc.collect()
+    gc.disable()
+    time_f_ns(func, *args)
+    samples = [time_f_ns(func, *args) for _ in range(nsamples)]
+    gc.enable()
+    return median(samples)
 
 def time_cpython_gmpy2(size, nrepeats):
-    vals_cpython = [(rand_ZZ(size), rand_ZZ(size)) for _ in range(nrepeats)]
-    vals_gmpy2 = [(mpz(z1), mpz(z2)) for z1, z2 in vals_cpython]
+    a_cpython = rand_ZZ_list(size, nrepeats)
+    b_cpython = rand_ZZ_list(size, nrepeats)
+    a_gmpy2 = [mpz(z) for z in a_cpython]
+    b_gmpy2 = [mpz(z) for z in b_cpython]
     if size < 2*8*1000**2:
-        t_cpython = time_f_ns(mul, vals_cpython) / nrepeats
+        t_cpython = time_median_ns(mul, a_cpython, b_cpython) / nrepeats
     else:
         t_cpython = None
-    t_gmpy2 = time_f_ns(mul, vals_gmpy2) / nrepeats
+    t_gmpy2 = time_median_ns(mul, a_gmpy2, b_gmpy2) / nrepeats
     return t_cpython, t_gmpy2
 
 bitsizes = list(range(1, 32))
@@ -13,11 +13,12 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 def rand_ZZ_poly(degree):
-    return [random.randint(1, 10) for _ in range(degree+1)]
+    return np.random.randint(1, 11, size=degree+1, dtype=np.int64).tolist()
 
-def time_f_ns(func, items, _time=time):
+def time_f_ns(func, item, nrepeats, _time=time):
+    func(item)
     tstart = _time()
-    for item in items:
+    for _ in range(nrepeats):
         func(item)
     tdelta = _time()  - tstart
     return tdelta * 1e6
@@ -25,13 +26,13 @@ def time_f_ns(func, items, _time=time):
 def time_sympy_flint(degree, nrepeats):
     c1 = rand_ZZ_poly(degree)
     c2 = rand_ZZ_poly(degree)
-    p3_sympy = [sympy.Poly(c1, x, domain='ZZ') * sympy.Poly(c2, x, domain='ZZ') for _ in range(nrepeats)]
-    p3_flint = [flint.fmpz_poly(c1[::-1]) * flint.fmpz_poly(c2[::-1]) for _ in range(nrepeats)]
+    p3_sympy = sympy.Poly(c1, x, domain='ZZ') * sympy.Poly(c2, x, domain='ZZ')
+    p3_flint = flint.fmpz_poly(c1[::-1]) * flint.fmpz_poly(c2[::-1])
     if degree < 150:
-        t_sympy = time_f_ns(lambda p: p.factor_list(), p3_sympy) / nrepeats
+        t_sympy = time_f_ns(lambda p: p.factor_list(), p3_sympy, nrepeats) / nrepeats
     else:
         t_sympy = None
-    t_flint = time_f_ns(lambda p: p.factor(), p3_flint) / nrepeats
+    t_flint = time_f_ns(lambda p: p.factor(), p3_flint, nrepeats) / nrepeats
     return t_sympy, t_flint
 
 degrees = [2, 3, 4, 5, 7, 10, 20, 30, 40, 50, 70, 80, 90, 100, 110, 120, 130, 150, 200, 300, 400, 500, 600, 700, 800, 900, 1000]